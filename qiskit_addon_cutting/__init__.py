@@ -27,6 +27,7 @@ Circuit Cutting
     partition_problem
     cut_gates
     generate_cutting_experiments
+    iter_cutting_experiments
     reconstruct_expectation_values
 
 .. autosummary::
@@ -87,7 +88,10 @@ from .cutting_decomposition import (
     cut_gates,
     PartitionedCuttingProblem,
 )
-from .cutting_experiments import generate_cutting_experiments
+from .cutting_experiments import (
+    generate_cutting_experiments,
+    iter_cutting_experiments,
+)
 from .cutting_reconstruction import reconstruct_expectation_values
 from .wire_cutting_transforms import cut_wires, expand_observables
 from .automated_cut_finding import find_cuts, DeviceConstraints, OptimizationParameters
@@ -103,6 +107,7 @@ __all__ = [
     "partition_problem",
     "cut_gates",
     "generate_cutting_experiments",
+    "iter_cutting_experiments",
     "reconstruct_expectation_values",
     "PartitionedCuttingProblem",
     "cut_wires",
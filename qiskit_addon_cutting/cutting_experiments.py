@@ -13,8 +13,11 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
-from collections.abc import Sequence, Hashable
+import copy
+import itertools
+import math
+import warnings
+from collections.abc import Callable, Iterator, Sequence, Hashable
 
 import numpy as np
 from qiskit.circuit import QuantumCircuit, ClassicalRegister
@@ -25,6 +28,7 @@ from .utils.observable_grouping import ObservableCollection, CommutingObservable
 from .qpd import (
     WeightType,
     QPDBasis,
+    BaseQPDGate,
     SingleQubitQPDGate,
     TwoQubitQPDGate,
     generate_qpd_weights,
@@ -82,6 +86,117 @@ def generate_cutting_experiments(
             to the same cut.
         ValueError: :class:`SingleQubitQPDGate` instances are not allowed in unseparated circuits.
     """
+    coefficients, num_groups_by_label, subexperiments = _prepare_cutting_experiments(
+        circuits, observables, num_samples, cache_decompositions=True
+    )
+
+    # The final length of each list of subexperiments is known in advance, so
+    # we allocate the lists up front and fill them in by index.
+    num_unique_samples = len(coefficients)
+    subexperiments_dict: dict[Hashable, list[QuantumCircuit]] = {
+        label: [None] * (num_unique_samples * num_groups)  # type: ignore
+        for label, num_groups in num_groups_by_label.items()
+    }
+    for label, z, j, subexperiment in subexperiments:
+        subexperiments_dict[label][z * num_groups_by_label[label] + j] = subexperiment
+
+    # If the input was a single quantum circuit, return the subexperiments as a list
+    if isinstance(circuits, QuantumCircuit):
+        assert len(subexperiments_dict.keys()) == 1
+        return list(subexperiments_dict.values())[0], coefficients
+
+    return subexperiments_dict, coefficients
+
+
+def iter_cutting_experiments(
+    circuits: QuantumCircuit | dict[Hashable, QuantumCircuit],
+    observables: PauliList | dict[Hashable, PauliList],
+    num_samples: int | float,
+) -> Iterator[
+    tuple[Hashable | None, int, int, QuantumCircuit, tuple[float, WeightType]]
+]:
+    r"""
+    Lazily generate cutting subexperiments and their associated coefficients.
+
+    This is a streaming variant of :func:`generate_cutting_experiments`, which
+    accepts the same arguments.  Rather than building every subexperiment up
+    front, it returns an iterator which constructs each subexperiment only when
+    it is requested.  This allows a caller, such as one submitting jobs to a
+    backend, to process the subexperiments in batches, without holding all of
+    them in memory at once.
+
+    Each item is a tuple ``(label, z, j, subexperiment, coefficient)``, where
+    ``label`` is the partition label of the subexperiment (or ``None`` if
+    ``circuits`` is a :class:`QuantumCircuit` instance), ``z`` is the index of
+    the unique sample, ``j`` is the index of the observable group, and
+    ``coefficient`` is the length-2 tuple containing the coefficient of sample
+    ``z`` and its :class:`WeightType`.  Each ``subexperiment`` is the same
+    circuit that :func:`generate_cutting_experiments` places at index
+    ``z * N + j`` of the subexperiments for ``label``, where ``N`` is the number
+    of observable groups of that partition.
+
+    The items are ordered by sample, in the same order as the coefficients
+    returned by :func:`generate_cutting_experiments`, which places the samples
+    with the largest weights first.  All subexperiments of a given sample, across
+    every partition and observable group, are yielded before those of the next
+    sample.
+
+    Args:
+        circuits: The circuit(s) to partition and separate
+        observables: The observable(s) to evaluate for each unique sample
+        num_samples: The number of samples to draw from the quasi-probability distribution. If set
+            to infinity, the weights will be generated rigorously rather than by sampling from
+            the distribution.
+    Returns:
+        An iterator over the cutting experiments and their associated coefficients
+
+    Raises:
+        ValueError: ``num_samples`` must be at least one.
+        ValueError: ``circuits`` and ``observables`` are incompatible types
+        ValueError: :class:`SingleQubitQPDGate` instances must have their cut ID
+            appended to the gate label so they may be associated with other gates belonging
+            to the same cut.
+        ValueError: :class:`SingleQubitQPDGate` instances are not allowed in unseparated circuits.
+    """
+    # The arguments are validated, and the samples are drawn, immediately; only
+    # the construction of the subexperiments is deferred.  Decompositions are
+    # not cached across samples, so that memory use does not grow as the
+    # iterator is consumed.
+    coefficients, _, subexperiments = _prepare_cutting_experiments(
+        circuits, observables, num_samples, cache_decompositions=False
+    )
+    is_separated = not isinstance(circuits, QuantumCircuit)
+    return (
+        (label if is_separated else None, z, j, subexperiment, coefficients[z])
+        for label, z, j, subexperiment in subexperiments
+    )
+
+
+def _prepare_cutting_experiments(
+    circuits: QuantumCircuit | dict[Hashable, QuantumCircuit],
+    observables: PauliList | dict[Hashable, PauliList],
+    num_samples: int | float,
+    *,
+    cache_decompositions: bool,
+) -> tuple[
+    list[tuple[float, WeightType]],
+    dict[Hashable, int],
+    Iterator[tuple[Hashable, int, int, QuantumCircuit]],
+]:
+    """Validate the inputs and prepare everything needed to build the subexperiments.
+
+    If ``cache_decompositions`` is ``True``, the decomposed subcircuits of
+    separated inputs are kept for the lifetime of the returned iterator, so
+    that samples sharing a partition's map ids can reuse them.  Otherwise, each
+    decomposition is shared only among the observable groups of its sample.
+
+    Returns:
+        A tuple containing the coefficient of each unique sample, the number of
+        observable groups of each partition, and an iterator which builds the
+        subexperiments one at a time, yielding each along with its partition
+        label, sample index, and observable group index.  A single input
+        circuit is given the partition label ``"A"``.
+    """
     if isinstance(circuits, QuantumCircuit) and not isinstance(observables, PauliList):
         raise ValueError(
             "If the input circuits is a QuantumCircuit, the observables must be a PauliList."
@@ -107,17 +222,22 @@ def generate_cutting_experiments(
             for label, subobservables in subobservables_by_subsystem.items()
         }
         # Gather the unique bases from the circuit
-        bases, qpd_gate_ids = _get_bases(circuits)
+        qpd_gate_ids, _, bases_dict = _scan_circuit(circuits, separated=False)
+        bases = list(bases_dict.values())
         subcirc_qpd_gate_ids: dict[Hashable, list[list[int]]] = {"A": qpd_gate_ids}
 
     else:
         is_separated = True
         subcircuit_dict = circuits
         # Gather the unique bases across the subcircuits
-        subcirc_qpd_gate_ids, subcirc_map_ids = _get_mapping_ids_by_partition(
-            subcircuit_dict
+        subcirc_qpd_gate_ids, subcirc_map_ids, bases_dict = (
+            _get_mapping_ids_by_partition(subcircuit_dict)
         )
-        bases = _get_bases_by_partition(subcircuit_dict, subcirc_qpd_gate_ids)
+        bases = [bases_dict[key] for key in sorted(bases_dict.keys())]
+        subcirc_map_ids_arr = {
+            label: np.asarray(map_ids, dtype=np.int64)
+            for label, map_ids in subcirc_map_ids.items()
+        }
 
         # Create the commuting observable groups
         subsystem_observables = {
@@ -127,119 +247,277 @@ def generate_cutting_experiments(
     # Sample the joint quasiprobability decomposition
     random_samples = generate_qpd_weights(bases, num_samples=num_samples)
 
-    # Calculate terms in coefficient calculation
-    kappa = np.prod([basis.kappa for basis in bases])
-    num_samples = sum([value[0] for value in random_samples.values()])
-
-    # Sort samples in descending order of frequency
-    sorted_samples = sorted(random_samples.items(), key=lambda x: x[1][0], reverse=True)
-
-    # Generate the output experiments and their respective coefficients
-    subexperiments_dict: dict[Hashable, list[QuantumCircuit]] = defaultdict(list)
-    coefficients: list[tuple[float, WeightType]] = []
-    for z, (map_ids, (redundancy, weight_type)) in enumerate(sorted_samples):
-        actual_coeff = np.prod(
-            [basis.coeffs[map_id] for basis, map_id in strict_zip(bases, map_ids)]
-        )
-        sampled_coeff = (redundancy / num_samples) * (kappa * np.sign(actual_coeff))
-        coefficients.append((sampled_coeff, weight_type))
-        map_ids_tmp = map_ids
-        for label, so in subsystem_observables.items():
-            subcircuit = subcircuit_dict[label]
-            if is_separated:
-                map_ids_tmp = tuple(map_ids[j] for j in subcirc_map_ids[label])
-            for j, cog in enumerate(so.groups):
-                new_qc = _append_measurement_register(subcircuit, cog)
-                decompose_qpd_instructions(
-                    new_qc, subcirc_qpd_gate_ids[label], map_ids_tmp, inplace=True
-                )
-                _append_measurement_circuit(new_qc, cog, inplace=True)
-                subexperiments_dict[label].append(new_qc)
-
-    # Remove initial and final resets from the subexperiments.  This will
-    # enable the `Move` operation to work on backends that don't support
-    # `Reset`, as long as qubits are not re-used.  See
-    # https://github.com/Qiskit/qiskit-addon-cutting/issues/452.
-    # While we are at it, we also consolidate each run of multiple resets
-    # (which can arise when re-using qubits) into a single reset.
-    for subexperiments in subexperiments_dict.values():
-        for circ in subexperiments:
-            _remove_resets_in_zero_state(circ)
-            _remove_final_resets(circ)
-            _consolidate_resets(circ)
-
-    # If the input was a single quantum circuit, return the subexperiments as a list
-    subexperiments_out: list[QuantumCircuit] | dict[Hashable, list[QuantumCircuit]] = (
-        dict(subexperiments_dict)
+    # Unpack the samples into parallel sequences of map ids, redundancies, and
+    # weight types, then sort them in descending order of frequency.  A
+    # stable sort keeps samples of equal frequency in the order that they were
+    # generated.
+    sample_keys = tuple(random_samples)
+    num_unique_samples = len(sample_keys)
+    redundancies = np.fromiter(
+        (value[0] for value in random_samples.values()),
+        dtype=np.float64,
+        count=num_unique_samples,
+    )
+    weight_types = tuple(value[1] for value in random_samples.values())
+    order = np.argsort(-redundancies, kind="stable").tolist()
+    sorted_keys = [sample_keys[i] for i in order]
+    redundancies = redundancies[order]
+
+    # Gather the map ids of the samples into an array, so the coefficient of
+    # each sample can be calculated in a single vectorized pass
+    num_bases = len(bases)
+    map_ids_arr = np.fromiter(
+        itertools.chain.from_iterable(sorted_keys),
+        dtype=np.int64,
+        count=num_unique_samples * num_bases,
+    ).reshape(num_unique_samples, num_bases)
+
+    # Calculate the coefficient of each sample
+    kappa = math.prod(basis.kappa for basis in bases)
+    sample_coeffs = _get_sample_coefficients(
+        _get_coefficient_matrix(bases), map_ids_arr, redundancies, kappa
+    )
+    coefficients: list[tuple[float, WeightType]] = [
+        (coeff, weight_types[i]) for coeff, i in strict_zip(sample_coeffs, order)
+    ]
+
+    # Gather the map ids relevant to each subcircuit for every sample.  For
+    # separated circuits, this slices the columns of each partition's cuts
+    # out of the full array once, rather than once per sample.
+    map_ids_by_label: dict[Hashable, list[tuple[int, ...]]]
+    if is_separated:
+        map_ids_by_label = {
+            label: list(map(tuple, map_ids_arr[:, map_ids].tolist()))
+            for label, map_ids in subcirc_map_ids_arr.items()
+        }
+    else:
+        map_ids_by_label = {"A": sorted_keys}
+
+    # Decomposing the QPD gates is expensive, so every observable group of a
+    # subsystem is measured on the same decomposed subcircuit.  In addition, a
+    # separated subcircuit often sees the same map ids for the cuts it contains
+    # across many samples, so those decompositions are cached across samples
+    # if requested.  The samples of a single circuit are all unique, so nothing
+    # is cached in that case.
+    decomp_cache: dict[tuple[Hashable, tuple[int, ...]], QuantumCircuit] | None = (
+        {} if is_separated and cache_decompositions else None
     )
-    assert isinstance(subexperiments_out, dict)
-    if isinstance(circuits, QuantumCircuit):
-        assert len(subexperiments_out.keys()) == 1
-        subexperiments_out = list(subexperiments_dict.values())[0]
 
-    return subexperiments_out, coefficients
+    # The observable groups of each subsystem are the same for every sample
+    groups_by_label = {
+        label: tuple(so.groups) for label, so in subsystem_observables.items()
+    }
+
+    # The measurements needed for each observable group are the same for every
+    # sample, so build each of them once, as a small circuit that will be
+    # composed onto the decomposed subcircuits.
+    meas_tails: dict[tuple[Hashable, int], QuantumCircuit] = {}
+    for label, groups in groups_by_label.items():
+        for j, cog in enumerate(groups):
+            num_qubits = subcircuit_dict[label].num_qubits
+            emit = _build_measurement_emitter(cog, num_qubits)
+            meas_tail = _append_measurement_register(QuantumCircuit(num_qubits), cog)
+            meas_tails[label, j] = emit(meas_tail, meas_tail.cregs[-1])
+
+    # Generate the output experiments lazily, in order of sample
+    def subexperiments() -> Iterator[tuple[Hashable, int, int, QuantumCircuit]]:
+        for z in range(num_unique_samples):
+            for label, groups in groups_by_label.items():
+                subcircuit = subcircuit_dict[label]
+                map_ids_tmp = map_ids_by_label[label][z]
+                decomp_key = (label, map_ids_tmp)
+                decomp_qc = (
+                    decomp_cache.get(decomp_key) if decomp_cache is not None else None
+                )
+                if decomp_qc is None:
+                    decomp_qc = decompose_qpd_instructions(
+                        subcircuit, subcirc_qpd_gate_ids[label], map_ids_tmp
+                    )
+                    if decomp_cache is not None:
+                        decomp_cache[decomp_key] = decomp_qc
+                for j in range(len(groups)):
+                    meas_qc = _combine_measurement_circuit(
+                        decomp_qc, meas_tails[label, j]
+                    )
+                    # Remove initial and final resets from the subexperiments.  This will
+                    # enable the `Move` operation to work on backends that don't support
+                    # `Reset`, as long as qubits are not re-used.  See
+                    # https://github.com/Qiskit/qiskit-addon-cutting/issues/452.
+                    # While we are at it, we also consolidate each run of multiple resets
+                    # (which can arise when re-using qubits) into a single reset.
+                    _remove_resets_in_zero_state(meas_qc)
+                    _remove_final_resets(meas_qc)
+                    _consolidate_resets(meas_qc)
+                    yield label, z, j, meas_qc
+
+    num_groups_by_label = {
+        label: len(groups) for label, groups in groups_by_label.items()
+    }
+
+    return coefficients, num_groups_by_label, subexperiments()
 
 
 def _get_mapping_ids_by_partition(
     circuits: dict[Hashable, QuantumCircuit],
-) -> tuple[dict[Hashable, list[list[int]]], dict[Hashable, list[int]]]:
-    """Get indices to the QPD gates in each subcircuit and relevant map ids."""
-    # Collect QPDGate id's and relevant map id's for each subcircuit
+) -> tuple[
+    dict[Hashable, list[list[int]]], dict[Hashable, list[int]], dict[int, QPDBasis]
+]:
+    """Get indices to the QPD gates in each subcircuit, relevant map ids, and the QPD basis of each cut."""
     subcirc_qpd_gate_ids: dict[Hashable, list[list[int]]] = {}
     subcirc_map_ids: dict[Hashable, list[int]] = {}
+    bases_dict: dict[int, QPDBasis] = {}
     for label, circ in circuits.items():
-        subcirc_qpd_gate_ids[label] = []
-        subcirc_map_ids[label] = []
-        for i, inst in enumerate(circ.data):
-            if isinstance(inst.operation, SingleQubitQPDGate):
-                try:
-                    decomp_id = int(inst.operation.label.split("_")[-1])
-                except (AttributeError, ValueError) as ex:
-                    raise ValueError(
-                        "SingleQubitQPDGate instances in input circuit(s) must have their "
-                        'labels suffixed with "_<id>", where <id> is the index of the cut '
-                        "relative to the other cuts in the circuit. For example, all "
-                        "SingleQubitQPDGates belonging to the same cut, N, should have labels "
-                        ' formatted as "<your_label>_N". This allows SingleQubitQPDGates '
-                        "belonging to the same cut to be sampled jointly."
-                    ) from ex
-                subcirc_qpd_gate_ids[label].append([i])
-                subcirc_map_ids[label].append(decomp_id)
-
-    return subcirc_qpd_gate_ids, subcirc_map_ids
-
-
-def _get_bases_by_partition(
-    circuits: dict[Hashable, QuantumCircuit],
-    subcirc_qpd_gate_ids: dict[Hashable, list[list[int]]],
-) -> list[QPDBasis]:
-    """Get a list of each unique QPD basis across the subcircuits."""
-    # Collect the bases corresponding to each decomposed operation
-    bases_dict = {}
-    for label, subcirc in subcirc_qpd_gate_ids.items():
-        circuit = circuits[label]
-        for basis_id in subcirc:
-            decomp_id = int(circuit.data[basis_id[0]].operation.label.split("_")[-1])
-            bases_dict[decomp_id] = circuit.data[basis_id[0]].operation.basis
-    bases = [bases_dict[key] for key in sorted(bases_dict.keys())]
-
-    return bases
-
-
-def _get_bases(circuit: QuantumCircuit) -> tuple[list[QPDBasis], list[list[int]]]:
-    """Get a list of each unique QPD basis in the circuit and the QPDGate indices."""
-    bases = []
-    qpd_gate_ids = []
-    for i, inst in enumerate(circuit):
-        if isinstance(inst.operation, SingleQubitQPDGate):
-            raise ValueError(
-                "SingleQubitQPDGates are not supported in unseparable circuits."
-            )
-        if isinstance(inst.operation, TwoQubitQPDGate):
-            bases.append(inst.operation.basis)
+        qpd_gate_ids, map_ids, circ_bases = _scan_circuit(circ, separated=True)
+        subcirc_qpd_gate_ids[label] = qpd_gate_ids
+        subcirc_map_ids[label] = map_ids
+        for decomp_id, basis in circ_bases.items():
+            bases_dict.setdefault(decomp_id, basis)
+
+    return subcirc_qpd_gate_ids, subcirc_map_ids, bases_dict
+
+
+def _scan_circuit(
+    circuit: QuantumCircuit, /, *, separated: bool
+) -> tuple[list[list[int]], list[int], dict[int, QPDBasis]]:
+    """Collect the QPD gate indices, map ids, and bases of a circuit in a single pass.
+
+    If ``separated`` is ``True``, the circuit is a subcircuit whose cuts are
+    represented by :class:`.SingleQubitQPDGate` instances, and the returned
+    bases are keyed by the decomposition id parsed from each gate's label.
+    Otherwise, the cuts are represented by :class:`.TwoQubitQPDGate`
+    instances, and the bases are keyed by the order in which they appear.
+    """
+    qpd_gate_ids: list[list[int]] = []
+    map_ids: list[int] = []
+    bases_dict: dict[int, QPDBasis] = {}
+    # Bind names locally to avoid repeated global and attribute lookups in the loop
+    data = circuit.data
+    base_gate = BaseQPDGate
+    single_gate = SingleQubitQPDGate
+    two_gate = TwoQubitQPDGate
+    for i in range(len(data)):
+        op = data[i].operation
+        # Most instructions are not QPD gates, so check for that first
+        if not isinstance(op, base_gate):
+            continue
+        if isinstance(op, single_gate):
+            if not separated:
+                raise ValueError(
+                    "SingleQubitQPDGates are not supported in unseparable circuits."
+                )
+            try:
+                decomp_id = int(op.label.rsplit("_", 1)[-1])
+            except (AttributeError, ValueError) as ex:
+                raise ValueError(
+                    "SingleQubitQPDGate instances in input circuit(s) must have their "
+                    'labels suffixed with "_<id>", where <id> is the index of the cut '
+                    "relative to the other cuts in the circuit. For example, all "
+                    "SingleQubitQPDGates belonging to the same cut, N, should have labels "
+                    ' formatted as "<your_label>_N". This allows SingleQubitQPDGates '
+                    "belonging to the same cut to be sampled jointly."
+                ) from ex
             qpd_gate_ids.append([i])
+            map_ids.append(decomp_id)
+            bases_dict.setdefault(decomp_id, op.basis)
+        elif not separated and isinstance(op, two_gate):
+            bases_dict[len(qpd_gate_ids)] = op.basis
+            qpd_gate_ids.append([i])
+
+    return qpd_gate_ids, map_ids, bases_dict
+
+
+def _get_coefficient_matrix(bases: Sequence[QPDBasis]) -> np.ndarray:
+    """Stack the coefficients of each basis into the rows of a zero-padded 2D array."""
+    num_maps = max((len(basis.coeffs) for basis in bases), default=0)
+    coeffs_mat = np.zeros((len(bases), num_maps))
+    for i, basis in enumerate(bases):
+        coeffs_mat[i, : len(basis.coeffs)] = basis.coeffs
+    return coeffs_mat
 
-    return bases, qpd_gate_ids
+
+def _get_sample_coefficients(
+    coeffs_mat: np.ndarray,
+    map_ids_arr: np.ndarray,
+    redundancies: np.ndarray,
+    kappa: float,
+) -> np.ndarray:
+    """Calculate the coefficient of each sample of the joint quasiprobability distribution.
+
+    Args:
+        coeffs_mat: The coefficients of each QPD basis, as returned by
+            :func:`_get_coefficient_matrix`
+        map_ids_arr: A 2D array holding the map id of each basis (columns) for
+            each sample (rows)
+        redundancies: The weight of each sample
+        kappa: The product of the kappas of the QPD bases
+
+    Returns:
+        A 1D array containing the coefficient of each sample
+
+    Raises:
+        ValueError: The number of bases in ``coeffs_mat`` and ``map_ids_arr`` differ.
+    """
+    # Validate the shapes once up front, rather than zipping the bases with
+    # the map ids of every sample
+    num_bases = coeffs_mat.shape[0]
+    if map_ids_arr.ndim != 2 or map_ids_arr.shape[1] != num_bases:
+        raise ValueError(
+            f"Map ids array has shape {map_ids_arr.shape}, but {num_bases} bases "
+            "were provided."
+        )
+    num_samples = redundancies.sum()
+    signs = np.sign(np.prod(coeffs_mat[np.arange(num_bases), map_ids_arr], axis=1))
+    return (redundancies / num_samples) * (kappa * signs)
+
+
+def _combine_measurement_circuit(
+    decomp_qc: QuantumCircuit, meas_tail: QuantumCircuit, /
+) -> QuantumCircuit:
+    """Combine a decomposed subcircuit with the measurements of an observable group.
+
+    Rather than copying ``decomp_qc`` and then adding a register to the copy,
+    the output circuit is allocated with all of its registers up front, and
+    both circuits are composed onto it.  This allows a single decomposition to
+    be shared by observable groups whose measurement registers differ in size.
+
+    Args:
+        decomp_qc: A subcircuit returned by :func:`.decompose_qpd_instructions`,
+            whose final register is therefore the ``"qpd_measurements"`` register
+        meas_tail: A circuit containing only the basis rotations and
+            measurements for an observable group, whose only classical register is
+            the ``"observable_measurements"`` register
+
+    Returns:
+        A new circuit, whose ``"observable_measurements"`` register immediately
+        precedes its ``"qpd_measurements"`` register
+    """
+    qpd_creg = decomp_qc.cregs[-1]
+    obs_creg = meas_tail.cregs[-1]
+    qc = QuantumCircuit(
+        decomp_qc.qubits,
+        *decomp_qc.qregs,
+        decomp_qc.clbits[: decomp_qc.num_clbits - qpd_creg.size],
+        *decomp_qc.cregs[:-1],
+        obs_creg,
+        qpd_creg,
+        name=decomp_qc.name,
+        metadata=copy.deepcopy(decomp_qc.metadata),
+    )
+    qc.compose(
+        decomp_qc, qubits=decomp_qc.qubits, clbits=decomp_qc.clbits, inplace=True
+    )
+    qc.compose(meas_tail, clbits=obs_creg, inplace=True)
+
+    # Carry over the attributes which ``QuantumCircuit.copy`` preserves, but
+    # which the constructor does not accept.  (Composing also resets the
+    # duration.)  The duration and unit are deprecated in Qiskit 1.3, but they
+    # must be preserved until they are removed.
+    qc._layout = decomp_qc.layout  # pylint: disable=protected-access
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        qc.duration = decomp_qc.duration
+        qc.unit = decomp_qc.unit
+    return qc
 
 
 def _append_measurement_register(
@@ -300,21 +578,9 @@ def _append_measurement_circuit(
     Returns:
         The modified circuit
     """
-    if qubit_locations is None:
-        # By default, the identity map.
-        if qc.num_qubits != cog.general_observable.num_qubits:
-            raise ValueError(
-                f"Quantum circuit qubit count ({qc.num_qubits}) does not match qubit "
-                f"count of observable(s) ({cog.general_observable.num_qubits}).  "
-                f"Try providing `qubit_locations` explicitly."
-            )
-        qubit_locations = range(cog.general_observable.num_qubits)
-    else:
-        if len(qubit_locations) != cog.general_observable.num_qubits:
-            raise ValueError(
-                f"qubit_locations has {len(qubit_locations)} element(s) but the "
-                f"observable(s) have {cog.general_observable.num_qubits} qubit(s)."
-            )
+    emit = _build_measurement_emitter(
+        cog, qc.num_qubits, qubit_locations=qubit_locations
+    )
 
     # Find observable_measurements register
     for reg in qc.cregs:
@@ -324,39 +590,88 @@ def _append_measurement_circuit(
     else:
         raise ValueError('Cannot locate "observable_measurements" register')
 
-    pauli_indices = _get_pauli_indices(cog)
-
-    if obs_creg.size != len(pauli_indices):
+    num_measurements = len(_get_pauli_indices(cog))
+    if obs_creg.size != num_measurements:
         raise ValueError(
             '"observable_measurements" register is the wrong size '
             "for the given commuting observable group "
-            f"({obs_creg.size} != {len(pauli_indices)})"
+            f"({obs_creg.size} != {num_measurements})"
         )
 
     if not inplace:
         qc = qc.copy()
 
-    # Append the appropriate measurements to qc
-    #
+    return emit(qc, obs_creg)
+
+
+def _build_measurement_emitter(
+    cog: CommutingObservableGroup,
+    num_qubits: int,
+    /,
+    *,
+    qubit_locations: Sequence[int] | None = None,
+) -> Callable[[QuantumCircuit, ClassicalRegister], QuantumCircuit]:
+    """Build a function which appends the measurements for a ``CommutingObservableGroup``.
+
+    The qubit locations are validated, and the circuit qubits to be rotated
+    and measured are computed, only once, when the function is built.  The
+    returned function appends the basis rotations and measurements to the
+    circuit passed to it, in place, placing the results in the given
+    register, and returns the circuit.  It performs no validation of its own.
+
+    Args:
+        cog: The commuting observable set for which to construct measurements
+        num_qubits: The number of qubits in the circuits to be measured
+        qubit_locations: A ``Sequence`` whose length is the number of qubits
+            in the observables, where each element holds that qubit's corresponding
+            index in the circuit.  By default, the circuit and observables are assumed
+            to have the same number of qubits, and the identity map
+            (i.e., ``range(num_qubits)``) is used.
+
+    Returns:
+        A function taking the circuit and its ``"observable_measurements"`` register
+    """
+    if qubit_locations is None:
+        # By default, the identity map.
+        if num_qubits != cog.general_observable.num_qubits:
+            raise ValueError(
+                f"Quantum circuit qubit count ({num_qubits}) does not match qubit "
+                f"count of observable(s) ({cog.general_observable.num_qubits}).  "
+                f"Try providing `qubit_locations` explicitly."
+            )
+        qubit_locations = range(cog.general_observable.num_qubits)
+    else:
+        if len(qubit_locations) != cog.general_observable.num_qubits:
+            raise ValueError(
+                f"qubit_locations has {len(qubit_locations)} element(s) but the "
+                f"observable(s) have {cog.general_observable.num_qubits} qubit(s)."
+            )
+
     # Implement the necessary basis rotations and measurements, as
     # in BackendEstimator._measurement_circuit().
-    genobs_x = cog.general_observable.x
-    genobs_z = cog.general_observable.z
-    for clbit, subqubit in enumerate(pauli_indices):
-        # subqubit is the index of the qubit in the subsystem.
-        # actual_qubit is its index in the system of interest (if different).
-        actual_qubit = qubit_locations[subqubit]
-        if genobs_x[subqubit]:
-            if genobs_z[subqubit]:
-                # Rotate Y basis to Z basis
-                qc.sx(actual_qubit)
-            else:
-                # Rotate X basis to Z basis
-                qc.h(actual_qubit)
+    #
+    # Each subqubit is the index of a qubit in the subsystem, which is mapped
+    # to its index in the system of interest (if different).
+    general_observable = cog.general_observable
+    # Y has both its x and z bits set, while X has only its x bit set
+    sx_subqubits = np.flatnonzero(general_observable.x & general_observable.z).tolist()
+    h_subqubits = np.flatnonzero(general_observable.x & ~general_observable.z).tolist()
+    sx_qubits = [qubit_locations[subqubit] for subqubit in sx_subqubits]
+    h_qubits = [qubit_locations[subqubit] for subqubit in h_subqubits]
+    meas_qubits = [qubit_locations[subqubit] for subqubit in _get_pauli_indices(cog)]
+
+    def emit(qc: QuantumCircuit, obs_creg: ClassicalRegister, /) -> QuantumCircuit:
+        if sx_qubits:
+            # Rotate Y basis to Z basis
+            qc.sx(sx_qubits)
+        if h_qubits:
+            # Rotate X basis to Z basis
+            qc.h(h_qubits)
         # Measure in Z basis
-        qc.measure(actual_qubit, obs_creg[clbit])
+        qc.measure(meas_qubits, obs_creg)
+        return qc
 
-    return qc
+    return emit
 
 
 def _get_pauli_indices(cog: CommutingObservableGroup) -> list[int]:
@@ -62,7 +62,7 @@ def decompose_qpd_instructions(
     _validate_qpd_instructions(circuit, instruction_ids)
 
     if not inplace:
-        circuit = circuit.copy()  # pragma: no cover
+        circuit = circuit.copy()
 
     if map_ids is not None:
         if len(instruction_ids) != len(map_ids):
@@ -16,6 +16,7 @@ from __future__ import annotations
 from collections.abc import Sequence
 from collections import Counter
 from enum import Enum
+from functools import lru_cache
 import itertools
 import logging
 import math
@@ -34,6 +35,10 @@ logger = logging.getLogger(__name__)
 # Numbers like this can often come up in the QPD coefficients.
 _NONZERO_ATOL = 1e-14
 
+# The largest number of exact weights for which the result of
+# generate_qpd_weights is cached when num_samples is infinite
+_EXACT_WEIGHTS_CACHE_MAX_SIZE = 4096
+
 
 class WeightType(Enum):
     """Type of weight associated with a QPD sample."""
@@ -242,16 +247,46 @@ def generate_qpd_weights(
         weight of the contribution.  The second element is the :class:`WeightType`,
         either ``EXACT`` or ``SAMPLED``.
     """
+    if (
+        num_samples == math.inf
+        and math.prod(len(basis.probabilities) for basis in qpd_bases)
+        <= _EXACT_WEIGHTS_CACHE_MAX_SIZE
+    ):
+        # Every weight is evaluated exactly, so the result depends only on the
+        # probabilities of each basis, and it can be reused by repeated calls
+        # on the same cut circuit (e.g., with different observables).  Only
+        # small tables are cached, so the cache cannot retain much memory.  A
+        # new dict is returned each time, so callers are free to modify it.
+        probabilities_key = tuple(
+            tuple(np.asarray(basis.probabilities, dtype=float).tolist())
+            for basis in qpd_bases
+        )
+        return dict(_generate_exact_qpd_weights(probabilities_key))
+
     independent_probabilities = [np.asarray(basis.probabilities) for basis in qpd_bases]
+    return dict(_generate_sorted_qpd_weights(independent_probabilities, num_samples))
+
+
+@lru_cache(maxsize=8)
+def _generate_exact_qpd_weights(
+    probabilities_key: tuple[tuple[float, ...], ...], /
+) -> tuple[tuple[tuple[int, ...], tuple[float, WeightType]], ...]:
+    """Generate the exact weights for the given probabilities, as cacheable items."""
+    independent_probabilities = [np.array(probs) for probs in probabilities_key]
+    return tuple(_generate_sorted_qpd_weights(independent_probabilities, math.inf))
+
+
+def _generate_sorted_qpd_weights(
+    independent_probabilities: Sequence[npt.NDArray[np.float64]], num_samples: float
+) -> list[tuple[tuple[int, ...], tuple[float, WeightType]]]:
     # In Python 3.7 and higher, dicts are guaranteed to remember their
     # insertion order.  For user convenience, we sort by exact weights first,
     # then sampled weights.  Within each, values are sorted largest to
     # smallest.
-    lst = sorted(
+    return sorted(
         _generate_qpd_weights(independent_probabilities, num_samples).items(),
         key=lambda x: ((v := x[1])[1].value, -v[0]),
     )
-    return dict(lst)
 
 
 def _generate_qpd_weights(
@@ -279,11 +314,8 @@ def _generate_qpd_weights(
         for map_ids in itertools.product(
             *[range(len(probs)) for probs in independent_probabilities]
         ):
-            probability = np.prod(
-                [
-                    probs[i]
-                    for i, probs in strict_zip(map_ids, independent_probabilities)
-                ]
+            probability = math.prod(
+                probs[i] for i, probs in strict_zip(map_ids, independent_probabilities)
             )
             if probability < _NONZERO_ATOL:
                 continue
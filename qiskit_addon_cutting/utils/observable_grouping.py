@@ -34,9 +34,6 @@ from qiskit.quantum_info import Pauli, PauliList
 from .iteration import strict_zip
 
 
-_I = Pauli("I")
-
-
 def observables_restricted_to_subsystem(
     qubits: Sequence[int], global_observables: Sequence[Pauli] | PauliList, /
 ) -> list[Pauli] | PauliList:
@@ -97,32 +94,40 @@ def most_general_observable(
         )
     if num_qubits is None:
         num_qubits = len(commuting_observables[0])
-    rv = Pauli((np.zeros(num_qubits), np.zeros(num_qubits)))
-    # TODO(perf): This is a slow Python loop within a loop, surely slower than
-    # it _could_ be, *especially* if given a PauliList.
-    #
-    # Indeed, this can be made better by using pauli.x and pauli.z arrays
-    # https://github.com/Qiskit/qiskit-terra/blob/061aee2685676271fd0860d0a2d699e36941ae5e/qiskit/primitives/backend_estimator.py#L403-L404
-    for j, obs in enumerate(commuting_observables):
-        if not isinstance(obs, Pauli):
-            raise ValueError("Input sequence includes something other than a Pauli.")
-        if len(obs) != num_qubits:
+    if isinstance(commuting_observables, PauliList):
+        if commuting_observables.num_qubits != num_qubits:
             raise ValueError(
-                f"Observable {j} has incorrect qubit count ({len(obs)} rather than "
-                f"{num_qubits})."
+                f"Observable 0 has incorrect qubit count "
+                f"({commuting_observables.num_qubits} rather than {num_qubits})."
             )
-        for i, o in enumerate(obs):
-            if o == _I:
-                continue
-            rv_i = rv[i]
-            if rv_i == o:
-                continue
-            if rv_i != _I:
+        obs_x = commuting_observables.x
+        obs_z = commuting_observables.z
+    else:
+        for j, obs in enumerate(commuting_observables):
+            if not isinstance(obs, Pauli):
                 raise ValueError(
-                    "Observables are incompatible; cannot construct a single general observable."
+                    "Input sequence includes something other than a Pauli."
                 )
-            rv[i] = o
-    return rv
+            if len(obs) != num_qubits:
+                raise ValueError(
+                    f"Observable {j} has incorrect qubit count ({len(obs)} rather than "
+                    f"{num_qubits})."
+                )
+        obs_x = np.array([obs.x for obs in commuting_observables])
+        obs_z = np.array([obs.z for obs in commuting_observables])
+    # Each qubit of the general observable is acted on by whichever
+    # non-identity Pauli acts on that qubit in any of the observables, as in
+    # https://github.com/Qiskit/qiskit-terra/blob/061aee2685676271fd0860d0a2d699e36941ae5e/qiskit/primitives/backend_estimator.py#L403-L404
+    rv_x = np.any(obs_x, axis=0)
+    rv_z = np.any(obs_z, axis=0)
+    # The observables are compatible only if every non-identity Pauli acting on
+    # a given qubit is that same Pauli.
+    support = obs_x | obs_z
+    if np.any(support & ((obs_x != rv_x) | (obs_z != rv_z))):
+        raise ValueError(
+            "Observables are incompatible; cannot construct a single general observable."
+        )
+    return Pauli((rv_z, rv_x))
 
 
 @dataclass(frozen=True)
@@ -145,10 +150,10 @@ class CommutingObservableGroup:
 
     def __post_init__(self) -> None:
         """Post-init method for the data class."""
-        # TODO(perf): These loops could be faster; see e.g. https://github.com/Qiskit/qiskit-terra/blob/061aee2685676271fd0860d0a2d699e36941ae5e/qiskit/primitives/backend_estimator.py#L398-L413
-        pauli_indices: list[int] = [
-            i for i, pauli in enumerate(self.general_observable) if pauli != _I
-        ]
+        general_observable = self.general_observable
+        pauli_indices: list[int] = np.flatnonzero(
+            general_observable.x | general_observable.z
+        ).tolist()
         pauli_bitmasks: list[int] = []
         for pauli in self.commuting_observables:
             if pauli.phase != 0:
@@ -156,11 +161,13 @@ class CommutingObservableGroup:
                     "CommutingObservableGroup only supports Paulis with phase == 0. "
                     f"(Value provided: {pauli.phase})"
                 )
-            v = 0
-            for i, j in enumerate(pauli_indices):
-                if pauli[j] != _I:
-                    v |= 1 << i
-            pauli_bitmasks.append(v)
+            # Bit i is set if the Pauli acts non-trivially on pauli_indices[i]
+            support = (pauli.x | pauli.z)[pauli_indices]
+            pauli_bitmasks.append(
+                int.from_bytes(
+                    np.packbits(support, bitorder="little").tobytes(), "little"
+                )
+            )
 
         # https://docs.python.org/3/library/dataclasses.html#frozen-instances
         # says "when using frozen=True: __init__() cannot use simple assignment
@@ -59,6 +59,7 @@ from qiskit_addon_cutting.qpd import (
 )
 from qiskit_addon_cutting.qpd.weights import (
     _generate_qpd_weights,
+    _generate_exact_qpd_weights,
     _generate_exact_weights_and_conditional_probabilities,
 )
 from qiskit_addon_cutting.qpd.decompositions import (
@@ -143,6 +144,25 @@ class TestQPDFunctions(unittest.TestCase):
             samples = generate_qpd_weights(bases, num_samples=math.inf)
             assert sum(w for w, t in samples.values()) == pytest.approx(1)
             assert all(t == WeightType.EXACT for w, t in samples.values())
+        with self.subTest("'Infinite' num_samples returns a fresh dict each call"):
+            bases = [self.qpd_gate1.basis, self.qpd_gate2.basis]
+            samples = generate_qpd_weights(bases, num_samples=math.inf)
+            expected = dict(samples)
+            samples.clear()
+            samples2 = generate_qpd_weights(bases, num_samples=math.inf)
+            assert samples2 is not samples
+            assert samples2 == expected
+        with self.subTest("'Infinite' num_samples caches only small tables"):
+            _generate_exact_qpd_weights.cache_clear()
+            bases = [self.qpd_gate1.basis, self.qpd_gate2.basis]
+            generate_qpd_weights(bases, num_samples=math.inf)
+            generate_qpd_weights(bases, num_samples=math.inf)
+            assert _generate_exact_qpd_weights.cache_info().hits == 1
+            cx_basis = QPDBasis.from_instruction(CXGate())
+            large_bases = [cx_basis] * 5
+            assert math.prod(len(b.maps) for b in large_bases) > 4096
+            generate_qpd_weights(large_bases, num_samples=math.inf)
+            assert _generate_exact_qpd_weights.cache_info().currsize == 1
 
     def test_decompose_qpd_instructions(self):
         with self.subTest("Empty circuit"):
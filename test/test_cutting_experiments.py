@@ -10,26 +10,36 @@
 # that they have been altered from the originals.
 
 
+import gc
 import unittest
+import warnings
+import weakref
+from unittest.mock import patch
 
 import pytest
 import numpy as np
 from qiskit.quantum_info import PauliList, Pauli
-from qiskit.circuit import QuantumCircuit, QuantumRegister
-from qiskit.circuit.library.standard_gates import CXGate
+from qiskit import transpile
+from qiskit.circuit import QuantumCircuit, QuantumRegister, ClassicalRegister
+from qiskit.circuit.library.standard_gates import CXGate, SwapGate
 
 from qiskit_addon_cutting.qpd import (
     SingleQubitQPDGate,
     TwoQubitQPDGate,
     QPDBasis,
+    decompose_qpd_instructions,
 )
 from qiskit_addon_cutting.utils.observable_grouping import CommutingObservableGroup
-from qiskit_addon_cutting import generate_cutting_experiments
+from qiskit_addon_cutting import generate_cutting_experiments, iter_cutting_experiments
 from qiskit_addon_cutting.qpd import WeightType
-from qiskit_addon_cutting import partition_problem
+from qiskit_addon_cutting import partition_problem, cut_gates
 from qiskit_addon_cutting.cutting_experiments import (
+    _get_coefficient_matrix,
+    _get_sample_coefficients,
+    _combine_measurement_circuit,
     _append_measurement_register,
     _append_measurement_circuit,
+    _build_measurement_emitter,
     _remove_final_resets,
     _consolidate_resets,
     _remove_resets_in_zero_state,
@@ -90,6 +100,27 @@ class TestCuttingExperiments(unittest.TestCase):
             for circ in subexperiments["A"]:
                 assert isinstance(circ, QuantumCircuit)
 
+        with self.subTest("subexperiments sharing a decomposition are distinct"):
+            qc = QuantumCircuit(3)
+            qc.cx(0, 1)
+            qc.cx(1, 2)
+            partitioned_problem = partition_problem(
+                qc, "ABC", observables=PauliList(["ZZZ", "XXX"])
+            )
+            subexperiments, coeffs = generate_cutting_experiments(
+                partitioned_problem.subcircuits,
+                partitioned_problem.subobservables,
+                np.inf,
+            )
+            for label, circuits in subexperiments.items():
+                num_groups = len(partitioned_problem.subobservables[label])
+                assert len(circuits) == len(coeffs) * num_groups
+                assert len({id(circ) for circ in circuits}) == len(circuits)
+                for circ in circuits:
+                    assert [creg.name for creg in circ.cregs] == [
+                        "observable_measurements",
+                        "qpd_measurements",
+                    ]
         with self.subTest("test bad num_samples"):
             qc = QuantumCircuit(4)
             with pytest.raises(ValueError) as e_info:
@@ -160,6 +191,167 @@ class TestCuttingExperiments(unittest.TestCase):
                 == "SingleQubitQPDGates are not supported in unseparable circuits."
             )
 
+    def test_iter_cutting_experiments(self):
+        with self.subTest("matches generate_cutting_experiments for dict input"):
+            qc = QuantumCircuit(3)
+            qc.cx(0, 1)
+            qc.cx(1, 2)
+            partitioned_problem = partition_problem(
+                qc, "ABC", observables=PauliList(["ZZZ", "XXX"])
+            )
+            subexperiments, coeffs = generate_cutting_experiments(
+                partitioned_problem.subcircuits,
+                partitioned_problem.subobservables,
+                np.inf,
+            )
+            num_items = 0
+            for label, z, j, circ, coeff in iter_cutting_experiments(
+                partitioned_problem.subcircuits,
+                partitioned_problem.subobservables,
+                np.inf,
+            ):
+                num_groups = len(subexperiments[label]) // len(coeffs)
+                assert circ == subexperiments[label][z * num_groups + j]
+                assert coeff == coeffs[z]
+                num_items += 1
+            assert num_items == sum(len(circs) for circs in subexperiments.values())
+        with self.subTest("single circuit input"):
+            qc = QuantumCircuit(2)
+            qc.append(
+                TwoQubitQPDGate(QPDBasis.from_instruction(CXGate()), label="cut_cx"),
+                qargs=[0, 1],
+            )
+            subexperiments, coeffs = generate_cutting_experiments(
+                qc, PauliList(["ZZ", "XX"]), np.inf
+            )
+            items = list(iter_cutting_experiments(qc, PauliList(["ZZ", "XX"]), np.inf))
+            assert [label for label, _, _, _, _ in items] == [None] * len(items)
+            assert [circ for _, _, _, circ, _ in items] == subexperiments
+            assert [(z, j) for _, z, j, _, _ in items] == [
+                (z, j) for z in range(len(coeffs)) for j in range(2)
+            ]
+        with self.subTest("decompositions are not held across samples"):
+            qc = QuantumCircuit(3)
+            qc.cx(0, 1)
+            qc.cx(1, 2)
+            partitioned_problem = partition_problem(
+                qc, "ABC", observables=PauliList(["ZZZ", "XXX"])
+            )
+            cut_circuit, _ = cut_gates(qc, [0, 1])
+            refs = []
+
+            def decompose_and_track(*args, **kwargs):
+                decomp_qc = decompose_qpd_instructions(*args, **kwargs)
+                refs.append(weakref.ref(decomp_qc))
+                return decomp_qc
+
+            for circuits, observables in [
+                (cut_circuit, PauliList(["ZZZ", "XXX"])),
+                (partitioned_problem.subcircuits, partitioned_problem.subobservables),
+            ]:
+                refs.clear()
+                max_held = 0
+                with patch(
+                    "qiskit_addon_cutting.cutting_experiments.decompose_qpd_instructions",
+                    decompose_and_track,
+                ):
+                    for i, _ in enumerate(
+                        iter_cutting_experiments(circuits, observables, np.inf)
+                    ):
+                        # Every circuit is part of a reference cycle, so
+                        # collect garbage before counting, but only
+                        # periodically since a full collection is slow.
+                        if i % 25 == 24:
+                            gc.collect()
+                            max_held = max(max_held, sum(r() is not None for r in refs))
+                assert len(refs) > 1
+                assert max_held == 1
+        with self.subTest("inputs are validated immediately"):
+            with pytest.raises(ValueError) as e_info:
+                iter_cutting_experiments(QuantumCircuit(4), PauliList(["ZZZZ"]), 0)
+            assert e_info.value.args[0] == "num_samples must be at least 1."
+
+    def test_get_coefficient_matrix(self):
+        cx_basis = QPDBasis.from_instruction(CXGate())
+        swap_basis = QPDBasis.from_instruction(SwapGate())
+        with self.subTest("Bases with different numbers of maps"):
+            coeffs_mat = _get_coefficient_matrix([cx_basis, swap_basis])
+            assert coeffs_mat.shape == (2, len(swap_basis.coeffs))
+            assert np.array_equal(coeffs_mat[0, :6], cx_basis.coeffs)
+            assert np.all(coeffs_mat[0, 6:] == 0)
+            assert np.array_equal(coeffs_mat[1], swap_basis.coeffs)
+        with self.subTest("No bases"):
+            assert _get_coefficient_matrix([]).shape == (0, 0)
+
+    def test_get_sample_coefficients(self):
+        bases = [
+            QPDBasis.from_instruction(CXGate()),
+            QPDBasis.from_instruction(SwapGate()),
+        ]
+        coeffs_mat = _get_coefficient_matrix(bases)
+        map_ids_arr = np.array([[0, 0], [3, 0], [3, 31], [1, 4]])
+        redundancies = np.array([4.0, 2.0, 1.0, 1.0])
+        kappa = bases[0].kappa * bases[1].kappa
+        coeffs = _get_sample_coefficients(coeffs_mat, map_ids_arr, redundancies, kappa)
+        assert np.allclose(coeffs, kappa * np.array([0.5, -0.25, 0.125, 0.125]))
+        with self.subTest("Mismatched number of bases"):
+            with pytest.raises(ValueError) as e_info:
+                _get_sample_coefficients(
+                    coeffs_mat, map_ids_arr[:, :1], redundancies, kappa
+                )
+            assert (
+                e_info.value.args[0]
+                == "Map ids array has shape (4, 1), but 2 bases were provided."
+            )
+
+    def test_combine_measurement_circuit(self):
+        qc = QuantumCircuit(QuantumRegister(2, "qr"), ClassicalRegister(1, "cr"))
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.measure(1, 0)
+        qpd_creg = ClassicalRegister(1, "qpd_measurements")
+        qc.add_register(qpd_creg)
+        qc.measure(0, qpd_creg[0])
+        cog = CommutingObservableGroup(Pauli("XZ"), list(PauliList(["IZ", "XI", "XZ"])))
+        meas_tail = _append_measurement_register(QuantumCircuit(2), cog)
+        _append_measurement_circuit(meas_tail, cog, inplace=True)
+
+        combined = _combine_measurement_circuit(qc, meas_tail)
+        assert [creg.name for creg in combined.cregs] == [
+            "cr",
+            "observable_measurements",
+            "qpd_measurements",
+        ]
+        assert combined.clbits == [
+            *combined.cregs[0],
+            *combined.cregs[1],
+            *combined.cregs[2],
+        ]
+        expected = QuantumCircuit(*qc.qregs, *combined.cregs)
+        expected.h(0)
+        expected.cx(0, 1)
+        expected.measure(1, 0)
+        expected.measure(0, 3)
+        expected.measure(0, 1)
+        expected.h(1)
+        expected.measure(1, 2)
+        assert combined == expected
+
+        with self.subTest("Layout, duration, and unit are preserved"):
+            laid_out = transpile(
+                qc, coupling_map=[[0, 1]], initial_layout=[1, 0], optimization_level=0
+            )
+            assert laid_out.layout is not None
+            laid_out.duration = 100
+            laid_out.unit = "dt"
+            combined = _combine_measurement_circuit(laid_out, meas_tail)
+            assert combined.layout is laid_out.layout
+            with warnings.catch_warnings():
+                # The duration and unit are deprecated as of Qiskit 1.3
+                warnings.simplefilter("ignore", DeprecationWarning)
+                assert combined.duration == 100
+                assert combined.unit == "dt"
+
     def test_append_measurement_register(self):
         qc = QuantumCircuit(2)
         qc.h(0)
@@ -223,6 +415,30 @@ class TestCuttingExperiments(unittest.TestCase):
                 == "Quantum circuit qubit count (2) does not match qubit count of observable(s) (1).  Try providing `qubit_locations` explicitly."
             )
 
+    def test_build_measurement_emitter(self):
+        cog = CommutingObservableGroup(Pauli("YX"), list(PauliList(["YI", "IX"])))
+        emit = _build_measurement_emitter(cog, 4, qubit_locations=[3, 1])
+        qc = QuantumCircuit(4)
+        obs_creg = ClassicalRegister(2, "observable_measurements")
+        qc.add_register(obs_creg)
+        expected = qc.copy()
+        expected.sx(1)
+        expected.h(3)
+        expected.measure([3, 1], obs_creg)
+        assert emit(qc, obs_creg) is qc
+        assert qc == expected
+        with self.subTest("Identity and Z qubits are not rotated"):
+            cog = CommutingObservableGroup(Pauli("XYZI"), [Pauli("XYZI")])
+            emit = _build_measurement_emitter(cog, 4)
+            qc = QuantumCircuit(4)
+            obs_creg = ClassicalRegister(3, "observable_measurements")
+            qc.add_register(obs_creg)
+            expected = qc.copy()
+            expected.sx(2)
+            expected.h(3)
+            expected.measure([1, 2, 3], obs_creg)
+            assert emit(qc, obs_creg) == expected
+
     def test_consolidate_double_reset(self):
         """Consolidate a pair of resets.
         qr0:--|0>--|0>--   ==>    qr0:--|0>--
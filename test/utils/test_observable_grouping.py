@@ -51,6 +51,13 @@ class TestEstimatorUtilities(unittest.TestCase):
                 e_info.value.args[0]
                 == "Observable 1 has incorrect qubit count (2 rather than 1)."
             )
+        with self.subTest("PauliList with wrong qubit count"):
+            with pytest.raises(ValueError) as e_info:
+                most_general_observable(PauliList(["XX"]), num_qubits=1)
+            assert (
+                e_info.value.args[0]
+                == "Observable 0 has incorrect qubit count (2 rather than 1)."
+            )
         with self.subTest("Pass strings instead of Paulis"):
             with pytest.raises(ValueError) as e_info:
                 most_general_observable(["X", "ZZ"])